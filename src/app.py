@@ -1,10 +1,16 @@
 """Main application module for the Water Flow Forces Calculator."""
 
+import os
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from io import BytesIO
+from pathlib import Path
 import pandas as pd
+import numpy as np
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
 from .constants import (
     EVENTS,
@@ -26,16 +32,77 @@ from .constants import (
     TECHNICAL_ASSUMPTIONS,
     LegType,
     LEG_TYPE_NAMES,
+    OutputFormat,
+    OUTPUT_FORMAT_NAMES,
     CD_VALUES,
     CD_PILE_VALUES,
+    MAX_PREVIEW_FILES,
 )
-from .calculations import calculate_forces, calculate_actual_debris_depth
-from .visualization import draw_column_diagram
-from .data_processing import process_dataframe
-from .models import PierConfig, BoredPileConfig
+from .calculations import calculate_forces_vec, calculate_actual_debris_depth
+from .visualization import render_column_diagram_png
+from .data_processing import process_dataframe, read_excel
+from .models import BoredPileConfig, CalculationInputs, PierConfig
 
-# Set decimal precision
-getcontext().prec = 28
+
+# Cached results are shared by every session, so bound how many uploads are
+# kept and for how long
+_WORKBOOK_CACHE_ENTRIES = 16
+
+
+class _WorkbookReadError(Exception):
+    """Raised when an uploaded workbook cannot be parsed."""
+
+
+@st.cache_data(show_spinner=False, max_entries=_WORKBOOK_CACHE_ENTRIES, ttl="1h")
+def _read_workbook(file_bytes: bytes) -> pd.DataFrame:
+    """Read an uploaded workbook, cached on the file contents."""
+    return read_excel(BytesIO(file_bytes))
+
+
+@st.cache_data(show_spinner=False, max_entries=_WORKBOOK_CACHE_ENTRIES, ttl="1h")
+def _process_workbook(file_bytes: bytes, inputs: CalculationInputs) -> pd.DataFrame:
+    """
+    Calculate forces for an uploaded workbook, cached on contents and inputs.
+
+    The workbook is only read on a cache miss, and the read is itself cached so
+    changing the inputs does not parse it again. ``inputs`` holds only the
+    values ``process_dataframe`` reads, so changing a preview-only widget does
+    not invalidate processed results.
+
+    Raises
+    ------
+    _WorkbookReadError
+        If the workbook cannot be read, chained from the original error
+    """
+    try:
+        df = _read_workbook(file_bytes)
+    except Exception as e:
+        raise _WorkbookReadError(str(e)) from e
+    return process_dataframe(df, inputs)
+
+
+def _warm_workbook(file_bytes: bytes, inputs: CalculationInputs) -> None:
+    """Fill the processing cache for a workbook without keeping its result."""
+    _process_workbook(file_bytes, inputs)
+
+
+def _deflated_entry(zip_file: ZipFile, name: str) -> ZipInfo:
+    """
+    Build a zip entry dated now, compressed with the archive's method and level.
+
+    Opening an entry by name would stamp it 1980-01-01 instead.
+    """
+    entry_info = ZipInfo(name, date_time=datetime.now().timetuple()[:6])
+    entry_info.compress_type = zip_file.compression
+    # ZipInfo has no public compression level before Python 3.13
+    entry_info._compresslevel = zip_file.compresslevel  # type: ignore
+    return entry_info
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _diagram_png(**kwargs) -> bytes:
+    """Render the force diagram to PNG, cached on the drawing arguments."""
+    return render_column_diagram_png(**kwargs)
 
 
 def main():
@@ -55,10 +122,6 @@ def main():
 
     st.sidebar.header("Structure Parameters")
 
-    inputs = {
-        "selected_event": selected_event
-    }  # Dictionary to store all input parameters
-
     # Structure type selection
     leg_type = st.sidebar.selectbox(
         "Structure Type",
@@ -66,109 +129,7 @@ def main():
         format_func=lambda x: LEG_TYPE_NAMES[x],
         help="Choose the type of structure",
     )
-    # Store leg type value as string for serialization
-    inputs["leg_type"] = str(leg_type.value)
-
-    # Show parameters based on structure type
-    if leg_type == LegType.PIER:
-        # Pier type inputs
-        column_diameter = st.sidebar.number_input(
-            "Column Diameter (m)",
-            min_value=0.1,
-            max_value=10.0,
-            value=DEFAULT_COLUMN_DIAMETER,
-            step=0.1,
-            help=f"Default: {DEFAULT_COLUMN_DIAMETER}m",
-        )
-        inputs["column_diameter"] = str(column_diameter)
-        # Create PierConfig with proper type annotation
-        pier_config: PierConfig = {"diameter": Decimal(str(column_diameter))}
-        leg_config = pier_config
-    else:
-        # Bored pile type inputs
-        wetted_area = st.sidebar.number_input(
-            "Wetted Area (m²)",
-            min_value=0.1,
-            max_value=100.0,
-            value=20.0,
-            step=0.1,
-            help="Cross-sectional area exposed to water flow",
-        )
-        inputs["wetted_area"] = str(wetted_area)
-        # Create BoredPileConfig with proper type annotation
-        bored_config: BoredPileConfig = {"area": Decimal(str(wetted_area))}
-        leg_config = bored_config
-
-    # Use CD value based on leg type
-    cd = st.sidebar.number_input(
-        "Above Ground Water Drag Coefficient (Cd)",
-        min_value=0.1,
-        max_value=2.0,
-        value=CD_VALUES[leg_type],
-        step=0.1,
-        help=f"Default: {CD_VALUES[leg_type]} for {LEG_TYPE_NAMES[leg_type]} above ground",
-    )
-    inputs["cd"] = str(cd)
-
-    # Set default pile diameter based on leg type
-    default_pile_diameter = (
-        DEFAULT_COLUMN_DIAMETER if leg_type == LegType.PIER else DEFAULT_PILE_DIAMETER
-    )
-    pile_diameter = st.sidebar.number_input(
-        "Below Ground Pile Diameter (m)",
-        min_value=0.0,
-        max_value=10.0,
-        value=default_pile_diameter,
-        step=0.1,
-        help="Diameter of the pile below ground (required for below-ground forces)",
-    )
-    inputs["pile_diameter"] = str(pile_diameter)
-
-    cd_pile = st.sidebar.number_input(
-        "Below Ground Water Drag Coefficient (Cd)",
-        min_value=0.0,
-        max_value=2.0,
-        value=CD_PILE_VALUES[leg_type],
-        step=0.1,
-        help=f"Default: {CD_PILE_VALUES[leg_type]} for {LEG_TYPE_NAMES[leg_type]} below ground",
-    )
-    inputs["cd_pile"] = str(cd_pile)
-
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("#### Preview Parameters")
-    st.sidebar.markdown("*(Will be overridden by Excel data)*")
-
-    # Group preview parameters together
-    preview_depth = st.sidebar.number_input(
-        "Water Depth (m)",
-        min_value=0.1,
-        max_value=20.0,
-        value=DEFAULT_WATER_DEPTH,
-        step=0.1,
-        help=f"Will be replaced by '{selected_event} Event Peak Flood Depth' from Excel",
-    )
-
-    preview_velocity = st.sidebar.number_input(
-        "Average Water Velocity (m/s)",
-        min_value=0.1,
-        max_value=10.0,
-        value=DEFAULT_WATER_VELOCITY,
-        step=0.1,
-        help=f"Will be replaced by '{selected_event} Event Peak Velocity' from Excel",
-    )
-
-    preview_scour_depth = st.sidebar.number_input(
-        "Visualization Scour Depth (m)",
-        min_value=0.0,
-        max_value=20.0,
-        value=DEFAULT_SCOUR_DEPTH,
-        step=0.1,
-        help="Depth below ground level shown in diagram (does not affect calculations)",
-    )
-    inputs["scour_depth"] = str(preview_scour_depth)  # Only used for diagram
-
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("#### Additional Parameters")
+    leg_type_name = LEG_TYPE_NAMES[leg_type]
 
     # Add AS5100 locking checkbox
     use_as5100 = st.sidebar.checkbox(
@@ -192,90 +153,208 @@ def main():
         help="Allow setting a maximum debris depth limit",
     )
 
-    # Min Debris Depth with AS5100 lock and enable checkbox
-    min_debris_disabled = use_as5100 or not enable_min_debris
-    min_debris_depth = st.sidebar.number_input(
-        "Min Debris Mat Depth (m)",
-        min_value=0.1,
-        max_value=10.0,
-        value=DEFAULT_MIN_DEBRIS_DEPTH,
-        step=0.1,
-        help="Minimum depth of debris mat",
-        disabled=min_debris_disabled,
-    )
-    inputs["min_debris_depth"] = str(min_debris_depth)
-
-    # Adjust min debris depth if disabled
-    if not enable_min_debris:
-        min_debris_depth = 0.0
-        inputs["min_debris_depth"] = "0.0"
-
-    # Max Debris Depth with AS5100 lock and enable checkbox
-    max_debris_disabled = use_as5100 or not enable_max_debris
-    max_debris_depth = st.sidebar.number_input(
-        "Max Debris Mat Depth (m)",
-        min_value=min_debris_depth,
-        max_value=10.0,
-        value=DEFAULT_MAX_DEBRIS_DEPTH,
-        step=0.1,
-        help="Maximum depth of debris mat",
-        disabled=max_debris_disabled,
-    )
-    inputs["max_debris_depth"] = str(max_debris_depth)
-
-    # Adjust max debris depth if disabled
-    if not enable_max_debris:
-        max_debris_depth = 1000_000.0
-        inputs["max_debris_depth"] = "1000_000.0"
-
-    # Log Mass (kg) - disabled when AS5100 is enabled
-    log_mass = st.sidebar.number_input(
-        "Log Mass (kg)",
-        min_value=100,
-        max_value=20000,
-        value=DEFAULT_LOG_MASS,
-        step=100,
-        help=f"Default: {DEFAULT_LOG_MASS}kg ({int(DEFAULT_LOG_MASS / 1000)} tons)",
-        disabled=use_as5100,
-    )
-    inputs["log_mass"] = str(log_mass)
-
-    # Stopping Distance with AS5100 lock
-    stopping_distance = st.sidebar.number_input(
-        "Stopping Distance (m)",
-        min_value=0.001,
-        max_value=1.0,
-        value=DEFAULT_STOPPING_DISTANCE,
-        step=0.001,
-        format="%.3f",
-        help=f"Default: {DEFAULT_STOPPING_DISTANCE}m ({int(DEFAULT_STOPPING_DISTANCE * 1000)}mm)",
-        disabled=use_as5100,
-    )
-    inputs["stopping_distance"] = str(stopping_distance)
-
-    # Load Factor
-    load_factor = st.sidebar.number_input(
-        "Load Factor",
-        min_value=0.1,
-        max_value=3.0,
-        value=DEFAULT_LOAD_FACTOR,
-        step=0.1,
-        help=f"Safety factor applied to all forces (Default: {DEFAULT_LOAD_FACTOR})",
-        disabled=use_as5100,
-    )
-    inputs["load_factor"] = str(load_factor)
-
-    # Water Surface Velocity Factor
-    water_surface_velocity_factor = st.sidebar.number_input(
-        "Water Surface Velocity Factor",
-        min_value=0.0,
-        max_value=10.0,
-        value=DEFAULT_SURFACE_VELOCITY_FACTOR,
-        step=0.1,
-        help="Factor to convert average velocity to surface velocity for log impact (Default: 1.4)",
-        disabled=use_as5100,
+    # Numeric inputs are batched in a form so that editing several of them
+    # reruns the app once, on submit, rather than after every change
+    with st.sidebar.form("parameters"):
+        # Show parameters based on structure type
+        column_diameter = wetted_area = None  # Only one applies per type
+        if leg_type == LegType.PIER:
+            # Pier type inputs
+            column_diameter = st.number_input(
+                "Column Diameter (m)",
+                min_value=0.1,
+                max_value=10.0,
+                value=DEFAULT_COLUMN_DIAMETER,
+                step=0.1,
+                help=f"Default: {DEFAULT_COLUMN_DIAMETER}m",
+            )
+            # Create PierConfig with proper type annotation
+            pier_config: PierConfig = {"diameter": Decimal(str(column_diameter))}
+            leg_config = pier_config
+        else:
+            # Bored pile type inputs
+            wetted_area = st.number_input(
+                "Wetted Area (m²)",
+                min_value=0.1,
+                max_value=100.0,
+                value=20.0,
+                step=0.1,
+                help="Cross-sectional area exposed to water flow",
+            )
+            # Create BoredPileConfig with proper type annotation
+            bored_config: BoredPileConfig = {"area": Decimal(str(wetted_area))}
+            leg_config = bored_config
+
+        # Use CD value based on leg type
+        cd = st.number_input(
+            "Above Ground Water Drag Coefficient (Cd)",
+            min_value=0.1,
+            max_value=2.0,
+            value=CD_VALUES[leg_type],
+            step=0.1,
+            help=f"Default: {CD_VALUES[leg_type]} for {leg_type_name} above ground",
+        )
+
+        # Set default pile diameter based on leg type
+        default_pile_diameter = (
+            DEFAULT_COLUMN_DIAMETER
+            if leg_type == LegType.PIER
+            else DEFAULT_PILE_DIAMETER
+        )
+        pile_diameter = st.number_input(
+            "Below Ground Pile Diameter (m)",
+            min_value=0.0,
+            max_value=10.0,
+            value=default_pile_diameter,
+            step=0.1,
+            help="Diameter of the pile below ground (required for below-ground forces)",
+        )
+
+        cd_pile = st.number_input(
+            "Below Ground Water Drag Coefficient (Cd)",
+            min_value=0.0,
+            max_value=2.0,
+            value=CD_PILE_VALUES[leg_type],
+            step=0.1,
+            help=f"Default: {CD_PILE_VALUES[leg_type]} "
+            f"for {leg_type_name} below ground",
+        )
+
+        st.markdown("---")
+        st.markdown("#### Preview Parameters")
+        st.markdown("*(Will be overridden by Excel data)*")
+
+        # Group preview parameters together
+        preview_depth = st.number_input(
+            "Water Depth (m)",
+            min_value=0.1,
+            max_value=20.0,
+            value=DEFAULT_WATER_DEPTH,
+            step=0.1,
+            help=f"Will be replaced by '{selected_event} Event Peak Flood Depth' "
+            "from Excel",
+        )
+
+        preview_velocity = st.number_input(
+            "Average Water Velocity (m/s)",
+            min_value=0.1,
+            max_value=10.0,
+            value=DEFAULT_WATER_VELOCITY,
+            step=0.1,
+            help=f"Will be replaced by '{selected_event} Event Peak Velocity' "
+            "from Excel",
+        )
+
+        preview_scour_depth = st.number_input(
+            "Visualization Scour Depth (m)",
+            min_value=0.0,
+            max_value=20.0,
+            value=DEFAULT_SCOUR_DEPTH,
+            step=0.1,
+            help="Depth below ground level shown in diagram "
+            "(does not affect calculations)",
+        )
+
+        st.markdown("---")
+        st.markdown("#### Additional Parameters")
+
+        # Min Debris Depth with AS5100 lock and enable checkbox
+        min_debris_disabled = use_as5100 or not enable_min_debris
+        min_debris_depth = st.number_input(
+            "Min Debris Mat Depth (m)",
+            min_value=0.1,
+            max_value=10.0,
+            value=DEFAULT_MIN_DEBRIS_DEPTH,
+            step=0.1,
+            help="Minimum depth of debris mat",
+            disabled=min_debris_disabled,
+        )
+
+        # Adjust min debris depth if disabled
+        if not enable_min_debris:
+            min_debris_depth = 0.0
+
+        # Max Debris Depth with AS5100 lock and enable checkbox
+        max_debris_disabled = use_as5100 or not enable_max_debris
+        max_debris_depth = st.number_input(
+            "Max Debris Mat Depth (m)",
+            min_value=min_debris_depth,
+            max_value=10.0,
+            value=DEFAULT_MAX_DEBRIS_DEPTH,
+            step=0.1,
+            help="Maximum depth of debris mat",
+            disabled=max_debris_disabled,
+        )
+
+        # Adjust max debris depth if disabled
+        if not enable_max_debris:
+            max_debris_depth = 1000_000.0
+
+        # Log Mass (kg) - disabled when AS5100 is enabled
+        log_mass = st.number_input(
+            "Log Mass (kg)",
+            min_value=100,
+            max_value=20000,
+            value=DEFAULT_LOG_MASS,
+            step=100,
+            help=f"Default: {DEFAULT_LOG_MASS}kg ({int(DEFAULT_LOG_MASS / 1000)} tons)",
+            disabled=use_as5100,
+        )
+
+        # Stopping Distance with AS5100 lock
+        stopping_distance = st.number_input(
+            "Stopping Distance (m)",
+            min_value=0.001,
+            max_value=1.0,
+            value=DEFAULT_STOPPING_DISTANCE,
+            step=0.001,
+            format="%.3f",
+            help=f"Default: {DEFAULT_STOPPING_DISTANCE}m "
+            f"({int(DEFAULT_STOPPING_DISTANCE * 1000)}mm)",
+            disabled=use_as5100,
+        )
+
+        # Load Factor
+        load_factor = st.number_input(
+            "Load Factor",
+            min_value=0.1,
+            max_value=3.0,
+            value=DEFAULT_LOAD_FACTOR,
+            step=0.1,
+            help="Safety factor applied to all forces "
+            f"(Default: {DEFAULT_LOAD_FACTOR})",
+            disabled=use_as5100,
+        )
+
+        # Water Surface Velocity Factor
+        water_surface_velocity_factor = st.number_input(
+            "Water Surface Velocity Factor",
+            min_value=0.0,
+            max_value=10.0,
+            value=DEFAULT_SURFACE_VELOCITY_FACTOR,
+            step=0.1,
+            help="Factor to convert average velocity to surface velocity "
+            "for log impact (Default: 1.4)",
+            disabled=use_as5100,
+        )
+
+        st.form_submit_button("Update", use_container_width=True)
+
+    inputs = CalculationInputs(
+        selected_event=selected_event,
+        leg_type=leg_type,
+        cd=cd,
+        pile_diameter=pile_diameter,
+        cd_pile=cd_pile,
+        min_debris_depth=min_debris_depth,
+        max_debris_depth=max_debris_depth,
+        log_mass=log_mass,
+        stopping_distance=stopping_distance,
+        load_factor=load_factor,
+        water_surface_velocity_factor=water_surface_velocity_factor,
+        column_diameter=column_diameter,
+        wetted_area=wetted_area,
     )
-    inputs["water_surface_velocity_factor"] = str(water_surface_velocity_factor)
 
     st.header("Preview Calculation")
     st.info(
@@ -283,60 +362,73 @@ def main():
         "These values will be replaced by the Excel columns when processing the file."
     )
 
-    # Convert preview values to Decimal for consistent precision
-    decimal_preview_depth = Decimal(str(preview_depth))
-    decimal_preview_velocity = Decimal(str(preview_velocity))
+    # The force calculations reject a bored pile without a pile diameter, so
+    # stop before computing a preview or processing files that would fail
+    if leg_type == LegType.BORED_PILE and pile_diameter == 0:
+        st.warning("Enter a below ground pile diameter for the bored pile type.")
+        return
 
     # Use adjusted values based on checkbox states
     actual_debris_depth = calculate_actual_debris_depth(
-        decimal_preview_depth,
-        Decimal(str(min_debris_depth)),
-        Decimal(str(max_debris_depth)),
+        preview_depth, min_debris_depth, max_debris_depth
     )
 
-    preview_scour_depth = Decimal(str(inputs["scour_depth"]))
-    decimal_pile_diameter = Decimal(str(inputs["pile_diameter"]))
-
-    forces = calculate_forces(
+    # The preview is only displayed to one decimal place, so use the float
+    # kernel rather than the Decimal reference implementation
+    force_arrays = calculate_forces_vec(
         leg_type=leg_type,
         leg_config=leg_config,
-        water_depth=decimal_preview_depth,
-        average_water_velocity=decimal_preview_velocity,
-        debris_mat_depth=actual_debris_depth,  # Already a Decimal
-        cd_pier=Decimal(str(inputs["cd"])),
-        log_mass=Decimal(str(inputs["log_mass"])),
-        stopping_distance=Decimal(str(inputs["stopping_distance"])),
-        load_factor=Decimal(str(inputs["load_factor"])),
-        water_surface_velocity_factor=Decimal(
-            str(inputs["water_surface_velocity_factor"])
-        ),
-        pile_diameter=decimal_pile_diameter,
-        cd_pile=Decimal(str(inputs["cd_pile"])),
+        water_depth=preview_depth,
+        average_water_velocity=preview_velocity,
+        debris_mat_depth=actual_debris_depth,
+        cd_pier=cd,
+        log_mass=float(log_mass),
+        stopping_distance=stopping_distance,
+        load_factor=load_factor,
+        water_surface_velocity_factor=water_surface_velocity_factor,
+        pile_diameter=pile_diameter,
+        cd_pile=cd_pile,
         scour_depth=preview_scour_depth,
     )
+    # Convert the 0-d results to plain floats once for display and drawing
+    forces = {name: float(np.asarray(value)) for name, value in force_arrays.items()}
 
+    # Each block is sent as one markdown element, with a blank line between
+    # paragraphs, rather than one element per line
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("Forces")
-        st.write(f"**F1 (Water Flow on Pier):** {float(forces['F1']):.1f} kN per pier")
-        st.write(f"**F2 (Debris):** {float(forces['F2']):.1f} kN")
-        st.write(f"**F3 (Log Impact):** {float(forces['F3']):.1f} kN")
-        st.write(
-            f"**Fd2 (Water Flow on Pile ):** {float(forces['Fd2']):.1f} kN per pile"
+        st.markdown(
+            "\n\n".join(
+                [
+                    f"**F1 (Water Flow on Pier):** {forces['F1']:.1f} kN per pier",
+                    f"**F2 (Debris):** {forces['F2']:.1f} kN",
+                    f"**F3 (Log Impact):** {forces['F3']:.1f} kN",
+                    f"**Fd2 (Water Flow on Pile ):** {forces['Fd2']:.1f} kN per pile",
+                ]
+            )
         )
 
     with col2:
         st.subheader("Locations")
-        st.write(f"**L1:** {float(forces['L1']):.1f} m")
-        st.write(f"**L2:** {float(forces['L2']):.1f} m")
-        st.write(f"**L3:** {float(forces['L3']):.1f} m")
-        st.write(f"**Ld2:** {float(forces['Ld2']):.1f} m")
+        st.markdown(
+            "\n\n".join(
+                f"**{name}:** {forces[name]:.1f} m"
+                for name in ("L1", "L2", "L3", "Ld2")
+            )
+        )
 
     st.subheader("Load Combinations")
-    st.write("All combinations include Fd2 (Water Flow on Pile below ground)")
-    st.write("**Combination 1: F1 (Water Flow) + F2 (Debris) + Fd2**")
-    st.write("**Combination 2: F1 (Water Flow) + F3 (Log Impact) + Fd2**")
-    st.write("*(Note: F2 and F3 do not occur simultaneously)*")
+    st.markdown(
+        "\n\n".join(
+            [
+                "All combinations include Fd2 (Water Flow on Pile below ground)",
+                "**Combination 1: F1 (Water Flow) + F2 (Debris) + Fd2**",
+                "**Combination 2: F1 (Water Flow) + F3 (Log Impact) + Fd2**",
+                "*(Note: F2 and F3 do not occur simultaneously)*",
+            ]
+        )
+    )
 
     # Show structure type illustration
     st.subheader("Structure Configuration")
@@ -349,37 +441,28 @@ def main():
     st.subheader("Force Diagram")
     # Get column diameter for diagram - for PIER use diameter, for BORED_PILE use pile diameter
     vis_column_diameter = (
-        float(inputs["column_diameter"])
-        if leg_type == LegType.PIER
-        else float(inputs["pile_diameter"])
+        inputs.column_diameter if leg_type == LegType.PIER else inputs.pile_diameter
     )
-    fig = draw_column_diagram(
-        water_depth=decimal_preview_depth,  # Use Decimal value directly
+    diagram_png = _diagram_png(
+        water_depth=preview_depth,
         column_diameter=vis_column_diameter,
-        debris_mat_depth=actual_debris_depth,  # Already a Decimal
-        F1=forces["F1"],
-        F2=forces["F2"],
-        F3=forces["F3"],
-        L1=forces["L1"],
-        L2=forces["L2"],
-        L3=forces["L3"],
-        Fd2=forces["Fd2"],
-        Ld2=forces["Ld2"],
-        pile_diameter=float(inputs["pile_diameter"]),
-        scour_depth=float(inputs["scour_depth"]),
+        debris_mat_depth=actual_debris_depth,
+        **forces,
+        pile_diameter=inputs.pile_diameter,
+        scour_depth=preview_scour_depth,
     )
-    st.pyplot(fig)
+    st.image(diagram_png, use_container_width=True)
 
     st.markdown("---")
     st.header("Terms and Conditions")
-    st.markdown(CALCULATOR_DESCRIPTION)
-    st.markdown(ENGINEERING_ASSUMPTIONS)
-    st.markdown(LEGAL_TERMS)
-    st.markdown(CONTACT_INFO)
+    st.markdown(
+        "\n\n".join(
+            [CALCULATOR_DESCRIPTION, ENGINEERING_ASSUMPTIONS, LEGAL_TERMS, CONTACT_INFO]
+        )
+    )
 
     st.header("Technical Assumptions")
-    for assumption in TECHNICAL_ASSUMPTIONS:
-        st.markdown(f"- {assumption}")
+    st.markdown("\n".join(f"- {assumption}" for assumption in TECHNICAL_ASSUMPTIONS))
 
     st.markdown("---")
     st.header("Excel Processing")
@@ -395,6 +478,15 @@ def main():
         """
     )
 
+    output_format = st.radio(
+        "Output Format",
+        list(OUTPUT_FORMAT_NAMES.keys()),
+        format_func=lambda x: OUTPUT_FORMAT_NAMES[x],
+        horizontal=True,
+        help="CSV is much faster to produce for large files. Each file's results "
+        "and its input parameters are saved as two separate CSV files.",
+    )
+
     uploaded_files = st.file_uploader(
         "Upload Excel files", type=["xlsx"], accept_multiple_files=True
     )
@@ -402,113 +494,159 @@ def main():
     if not uploaded_files:
         return
 
-    from zipfile import ZipFile
-
-    processed_files = []
     all_results_preview = []
+    processed_count = 0
+
+    # The terms and parameters are the same for every file, so build them once
+    terms_df = pd.DataFrame(
+        {
+            "Terms": [
+                CALCULATOR_DESCRIPTION,
+                ENGINEERING_ASSUMPTIONS,
+                LEGAL_TERMS,
+                CONTACT_INFO,
+                "",
+                "Embedded Design Assumptions:",
+                *[f"- {assumption}" for assumption in TECHNICAL_ASSUMPTIONS],
+                "",
+            ]
+        }
+    )
 
-    for uploaded_file in uploaded_files:
-        try:
-            df = pd.read_excel(uploaded_file)
-        except Exception as e:
-            st.error(f"Error reading file {uploaded_file.name}: {str(e)}")
-            continue
-
-        try:
-            result_df = process_dataframe(df, inputs)
-        except ValueError as e:
-            st.error(f"Error processing file {uploaded_file.name}: {str(e)}")
-            continue
-        except Exception as e:
-            st.error(
-                f"An unexpected error occurred with file {uploaded_file.name}: {str(e)}"
-            )
-            continue
-
-        # Create terms dataframe
-        terms_df = pd.DataFrame(
-            {
-                "Terms": [
-                    CALCULATOR_DESCRIPTION,
-                    ENGINEERING_ASSUMPTIONS,
-                    LEGAL_TERMS,
-                    CONTACT_INFO,
-                    "",
-                    "Embedded Design Assumptions:",
-                    *[f"- {assumption}" for assumption in TECHNICAL_ASSUMPTIONS],
-                    "",
-                ]
-            }
-        )
-
-        # Create parameters dataframe with exact values
-        type_specific_params = (
-            {"Column Diameter (m)": inputs["column_diameter"]}
-            if leg_type == LegType.PIER
-            else {"Wetted Area (m²)": inputs["wetted_area"]}
-        )
-
-        params_df = pd.DataFrame(
-            {
-                "Parameter": [
-                    "Selected Event",
-                    "Structure Type",
-                    *type_specific_params.keys(),
-                    "Water Drag Coefficient (Cd)",
-                    "Debris Span (m)",
-                    "Log Mass (kg)",
-                    "Stopping Distance (m)",
-                    "Load Factor",
-                    "Water Surface Velocity Factor",
-                    "Pile Diameter (m)",
-                    "Pile Drag Coefficient (Cd)",
-                ],
-                "Value": [
-                    inputs["selected_event"],
-                    LEG_TYPE_NAMES[leg_type],
-                    *type_specific_params.values(),
-                    str(Decimal(str(inputs["cd"]))),
-                    "20.0",  # Debris span is hard-coded
-                    str(Decimal(str(inputs["log_mass"]))),
-                    str(Decimal(str(inputs["stopping_distance"]))),
-                    str(Decimal(str(inputs["load_factor"]))),
-                    str(Decimal(str(inputs["water_surface_velocity_factor"]))),
-                    str(Decimal(str(inputs["pile_diameter"]))),
-                    str(Decimal(str(inputs["cd_pile"]))),
-                ],
-            }
-        )
-
-        # Create Excel file in memory
-        excel_buffer = BytesIO()
-        with pd.ExcelWriter(excel_buffer, engine="openpyxl") as writer:
-            result_df.to_excel(writer, sheet_name="Results", index=False)
-            terms_df.to_excel(writer, sheet_name="Input Parameters", index=False)
-            params_df.to_excel(
-                writer,
-                sheet_name="Input Parameters",
-                startrow=len(terms_df) + 1,
-                index=False,
-            )
+    # Create parameters dataframe with exact values
+    type_specific_params = (
+        {"Column Diameter (m)": str(inputs.column_diameter)}
+        if leg_type == LegType.PIER
+        else {"Wetted Area (m²)": str(inputs.wetted_area)}
+    )
 
-        excel_buffer.seek(0)
-        processed_files.append((f"forces_results_{uploaded_file.name}", excel_buffer))
-        all_results_preview.append(result_df)
+    params_df = pd.DataFrame(
+        {
+            "Parameter": [
+                "Selected Event",
+                "Structure Type",
+                *type_specific_params.keys(),
+                "Water Drag Coefficient (Cd)",
+                "Debris Span (m)",
+                "Log Mass (kg)",
+                "Stopping Distance (m)",
+                "Load Factor",
+                "Water Surface Velocity Factor",
+                "Pile Diameter (m)",
+                "Pile Drag Coefficient (Cd)",
+            ],
+            "Value": [
+                inputs.selected_event,
+                leg_type_name,
+                *type_specific_params.values(),
+                str(inputs.cd),
+                "20.0",  # Debris span is hard-coded
+                str(inputs.log_mass),
+                str(inputs.stopping_distance),
+                str(inputs.load_factor),
+                str(inputs.water_surface_velocity_factor),
+                str(inputs.pile_diameter),
+                str(inputs.cd_pile),
+            ],
+        }
+    )
 
-    if not processed_files:
+    # Workbook parsing dominates, and calamine releases the GIL while it
+    # parses, so with more than one core fill the processing cache for all the
+    # uploads concurrently. Workers return nothing, so no frames are held while
+    # they run, and only each one's exception is kept. With more uploads than
+    # the cache holds, early results would be evicted before the loop below
+    # reached them, so those are processed one at a time instead. Workers share
+    # this session's script context so the cached functions run as they would
+    # here
+    uploads = [(f.name, f.getvalue()) for f in uploaded_files]
+    max_workers = min(len(uploads), os.cpu_count() or 1)
+    errors: list[BaseException | None] = [None] * len(uploads)
+    if max_workers > 1 and len(uploads) <= _WORKBOOK_CACHE_ENTRIES:
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            initializer=add_script_run_ctx,
+            initargs=(None, get_script_run_ctx()),
+        ) as executor:
+            futures = [
+                executor.submit(_warm_workbook, file_bytes, inputs)
+                for _, file_bytes in uploads
+            ]
+            errors = [future.exception() for future in futures]
+
+    # Write each file's output straight into its zip entry rather than
+    # building it in a separate buffer first. Level 1 compression roughly
+    # halves CSV output for little extra time
+    zip_buffer = BytesIO()
+    with ZipFile(
+        zip_buffer, "w", compression=ZIP_DEFLATED, compresslevel=1
+    ) as zip_file:
+        for (file_name, file_bytes), error in zip(uploads, errors):
+            try:
+                # A failed result is not cached, so report it without retrying
+                if error is not None:
+                    raise error
+                result_df = _process_workbook(file_bytes, inputs)
+            except _WorkbookReadError as e:
+                st.error(f"Error reading file {file_name}: {str(e)}")
+                continue
+            except ValueError as e:
+                st.error(f"Error processing file {file_name}: {str(e)}")
+                continue
+            except Exception as e:
+                st.error(
+                    f"An unexpected error occurred with file {file_name}: {str(e)}"
+                )
+                continue
+
+            if output_format == OutputFormat.CSV:
+                # Parameters follow the terms after a blank line, as on the
+                # Input Parameters sheet. UTF-8 with a BOM so Excel detects the
+                # encoding when opening
+                stem = Path(file_name).stem
+                results_info = _deflated_entry(zip_file, f"forces_results_{stem}.csv")
+                with zip_file.open(results_info, "w") as entry:
+                    result_df.to_csv(
+                        entry, index=False, na_rep="N/A", encoding="utf-8-sig"
+                    )
+                params_info = _deflated_entry(zip_file, f"forces_parameters_{stem}.csv")
+                with zip_file.open(params_info, "w") as entry:
+                    terms_df.to_csv(entry, index=False, encoding="utf-8-sig")
+                    entry.write(b"\n")
+                    params_df.to_csv(entry, index=False, encoding="utf-8")
+            else:
+                # Workbooks are already compressed, so store them as they are
+                entry_info = ZipInfo(
+                    f"forces_results_{file_name}",
+                    date_time=datetime.now().timetuple()[:6],
+                )
+                with zip_file.open(entry_info, "w") as entry:
+                    with pd.ExcelWriter(entry, engine="xlsxwriter") as writer:
+                        result_df.to_excel(
+                            writer, sheet_name="Results", index=False, na_rep="N/A"
+                        )
+                        terms_df.to_excel(
+                            writer, sheet_name="Input Parameters", index=False
+                        )
+                        params_df.to_excel(
+                            writer,
+                            sheet_name="Input Parameters",
+                            startrow=len(terms_df) + 1,
+                            index=False,
+                        )
+            processed_count += 1
+            # Only keep the frames that will be previewed
+            if len(all_results_preview) < MAX_PREVIEW_FILES:
+                all_results_preview.append(result_df)
+
+    if not processed_count:
         st.error("No files were successfully processed")
         return
 
-    # Create zip file in memory
-    zip_buffer = BytesIO()
-    with ZipFile(zip_buffer, "w") as zip_file:
-        for filename, excel_buffer in processed_files:
-            zip_file.writestr(filename, excel_buffer.getvalue())
-
     zip_buffer.seek(0)
 
     # Show results preview
-    st.success(f"Successfully processed {len(processed_files)} files")
+    st.success(f"Successfully processed {processed_count} files")
     st.subheader("Results Preview")
 
     for i, result_df in enumerate(all_results_preview):
@@ -520,10 +658,15 @@ def main():
                 f"Converting problematic columns to string type for File {i + 1}..."
             )
             object_columns = result_df.select_dtypes(include=["object"]).columns
-            for col in object_columns:
-                result_df[col] = result_df[col].astype(str)
+            result_df[object_columns] = result_df[object_columns].astype(str)
             st.dataframe(result_df)
 
+    if processed_count > len(all_results_preview):
+        st.caption(
+            f"Previews are shown for the first {MAX_PREVIEW_FILES} files only. "
+            "Download the zip file for all results."
+        )
+
     # Download button for zip file
     st.download_button(
         label="Download All Results as Zip",
@@ -1,9 +1,39 @@
 """Core calculation functions for the Water Flow Forces Calculator."""
 
-from decimal import Decimal
-from .models import ForceResults, LegConfig
+from bisect import bisect_left
+from decimal import Context, Decimal, localcontext
+import numpy as np
+from .models import ForceArrays, ForceResults, LegConfig
 from .constants import DEBRIS_SPAN, LegType
 
+# Decimal arithmetic context and constants, built once at import
+_DECIMAL_CONTEXT = Context(prec=28)
+_HALF = Decimal("0.5")
+_TWO = Decimal("2")
+_THREE = Decimal("3")
+_THOUSAND = Decimal("1000")
+_SQRT_TWO = _DECIMAL_CONTEXT.sqrt(_TWO)
+_DEBRIS_SPAN = Decimal(str(DEBRIS_SPAN))
+
+# Segments of the Cd(V²y) curve shared by ``Cd`` and ``Cd_vec``. Segment i
+# covers V²y up to _CD_BREAKPOINTS[i] (the last is unbounded) and applies the
+# published slope from its start, Cd = intercept - slope * (V²y - origin)
+_CD_BREAKPOINTS = (40, 60, 85, 100, 130, 260)
+_CD_ORIGINS = (0, 40, 60, 85, 100, 130, 260)
+_CD_INTERCEPTS = tuple(
+    Decimal(value) for value in ("3.4", "3.4", "2.8", "2.35", "2.2", "1.95", "1.4")
+)
+_CD_SLOPES = tuple(
+    Decimal(value)
+    for value in ("0", "0.03", "0.018", "0.01", "0.00833", "0.00423", "0")
+)
+
+# The same segments as float64 arrays for the vectorized lookup
+_CD_BREAKPOINTS_ARRAY = np.array(_CD_BREAKPOINTS, dtype=np.float64)
+_CD_ORIGINS_ARRAY = np.array(_CD_ORIGINS, dtype=np.float64)
+_CD_INTERCEPTS_ARRAY = np.array([float(value) for value in _CD_INTERCEPTS])
+_CD_SLOPES_ARRAY = np.array([float(value) for value in _CD_SLOPES])
+
 
 def Cd(V: Decimal, y: Decimal) -> Decimal:
     """
@@ -41,40 +71,57 @@ def Cd(V: Decimal, y: Decimal) -> Decimal:
     """
     V2y = V**2 * y
 
-    if V2y <= 40:
-        return Decimal("3.4")
-    elif V2y <= 60:
-        return Decimal("3.4") - Decimal("0.03") * (V2y - 40)
-    elif V2y <= 85:
-        return Decimal("2.8") - Decimal("0.018") * (V2y - 60)
-    elif V2y <= 100:
-        return Decimal("2.35") - Decimal("0.01") * (V2y - 85)
-    elif V2y <= 130:
-        return Decimal("2.2") - Decimal("0.00833") * (V2y - 100)
-    elif V2y <= 260:
-        return Decimal("1.95") - Decimal("0.00423") * (V2y - 130)
-    else:
-        return Decimal("1.4")
+    segment = bisect_left(_CD_BREAKPOINTS, V2y)
+    if not _CD_SLOPES[segment]:
+        return _CD_INTERCEPTS[segment]
+    return _CD_INTERCEPTS[segment] - _CD_SLOPES[segment] * (V2y - _CD_ORIGINS[segment])
+
+
+def Cd_vec(V: np.ndarray | float, y: np.ndarray | float) -> np.ndarray | float:
+    """
+    Vectorized drag coefficient C_d for pier-debris blockage.
+
+    Evaluates the same piecewise-linear definition as ``Cd`` over whole
+    arrays of velocity and depth in float64, finding each element's segment
+    with a single binary search rather than testing every branch.
+
+    Parameters
+    ----------
+    V : np.ndarray or float
+        Approach-flow velocity in m/s.
+    y : np.ndarray or float
+        Mean flow depth in m.
+
+    Returns
+    -------
+    np.ndarray or float
+        Dimensionless drag coefficient, C_d, for each element.
+    """
+    V2y = V * V * y
+    segment = np.searchsorted(_CD_BREAKPOINTS_ARRAY, V2y)
+    return _CD_INTERCEPTS_ARRAY[segment] - _CD_SLOPES_ARRAY[segment] * (
+        V2y - _CD_ORIGINS_ARRAY[segment]
+    )
 
 
-def calculate_actual_debris_depth(
-    water_depth: Decimal, min_debris_depth: Decimal, max_debris_depth: Decimal
-) -> Decimal:
+def calculate_actual_debris_depth[
+    T: (float, Decimal)
+](water_depth: T, min_debris_depth: T, max_debris_depth: T) -> T:
     """
     Calculate actual debris depth based on water depth and constraints.
 
     Parameters
     ----------
-    water_depth : Decimal
+    water_depth : float or Decimal
         The depth of water
-    min_debris_depth : Decimal
-        Minimum allowed debris depth
-    max_debris_depth : Decimal
-        Maximum allowed debris depth
+    min_debris_depth : float or Decimal
+        Minimum allowed debris depth, of the same type as water_depth
+    max_debris_depth : float or Decimal
+        Maximum allowed debris depth, of the same type as water_depth
 
     Returns
     -------
-    Decimal
+    float or Decimal
         The actual debris depth constrained by min and max values
     """
     return min(max_debris_depth, max(min_debris_depth, water_depth))
@@ -139,69 +186,196 @@ def calculate_forces(
     TypeError
         If leg_config doesn't match leg_type
     """
+    with localcontext(_DECIMAL_CONTEXT):
+        # Calculate above-ground forces based on leg type
+        if leg_type == LegType.PIER:
+            # Pier type: use diameter and water depth for wetted area
+            if not isinstance(leg_config, dict) or "diameter" not in leg_config:
+                raise TypeError("Pier type requires PierConfig with diameter")
+            column_diameter = leg_config["diameter"]
+            Ad = water_depth * column_diameter
+            F1 = _HALF * cd_pier * (average_water_velocity**2) * Ad * load_factor
+            L1 = water_depth / _TWO  # Mid-height for pier type
+        else:
+            # Bored pile type: use explicit area and 2/3 water depth
+            if not isinstance(leg_config, dict) or "area" not in leg_config:
+                raise TypeError("Bored pile type requires BoredPileConfig with area")
+            # area is just the area of a single face of the triangular leg of transmission tower
+            # critical case is 45 degrees, and there are two faces
+            # so the wetted area normal to the flow is area * sqrt(2)
+            Ad = leg_config["area"] * _SQRT_TWO
+            F1 = _HALF * cd_pier * (average_water_velocity**2) * Ad * load_factor
+            L1 = (_TWO * water_depth) / _THREE  # 2/3 height for bored pile
+
+        # Calculate surface velocity
+        surface_velocity = average_water_velocity * water_surface_velocity_factor
+
+        # Calculate debris forces (same for both types)
+        Adeb = debris_mat_depth * _DEBRIS_SPAN
+        C_debris = Cd(surface_velocity, water_depth)
+        F2 = _HALF * C_debris * (surface_velocity**2) * Adeb * load_factor
+        L2 = max(water_depth - (debris_mat_depth / _TWO), debris_mat_depth / _TWO)
+
+        # Calculate log impact force
+        acceleration = (surface_velocity**2) / (_TWO * stopping_distance)
+        F3 = log_mass * acceleration * load_factor / _THOUSAND  # Convert to kN
+        L3 = water_depth
+
+        if scour_depth < 0 or pile_diameter < 0:
+            raise ValueError("Scour depth and pile diameter must be non-negative.")
+
+        # Use column diameter if no pile diameter specified
+        # Validate and get pile diameter
+        if pile_diameter == 0:
+            if leg_type == LegType.PIER:
+                if isinstance(leg_config, dict) and "diameter" in leg_config:
+                    pile_diameter = leg_config["diameter"]  # type: ignore
+                else:
+                    raise TypeError("Pier type requires PierConfig with diameter")
+            else:  # BORED_PILE
+                raise ValueError("Pile diameter must be specified for bored pile type")
+
+        Ad2 = scour_depth * pile_diameter  # Forces only apply to scoured area
+        # Fd2 - Water Flow Force on pile
+        Fd2 = _HALF * cd_pile * (average_water_velocity**2) * Ad2 * load_factor
+        Ld2 = -scour_depth / _TWO  # Force acts at midpoint of scoured area
+
+        return {
+            "F1": F1,  # Water Flow Force (kN)
+            "L1": L1,  # Height of F1 application (m)
+            "F2": F2,  # Debris Force (kN)
+            "L2": L2,  # Height of F2 application (m)
+            "F3": F3,  # Log Impact Force (kN)
+            "L3": L3,  # Height of F3 application (m)
+            "Fd2": Fd2,  # Water Flow Force on pile (kN)
+            "Ld2": Ld2,  # Height of Fd2 application (m)
+        }
+
+
+def calculate_forces_vec(
+    leg_type: LegType,
+    leg_config: LegConfig,
+    water_depth: np.ndarray | float,
+    average_water_velocity: np.ndarray | float,
+    debris_mat_depth: np.ndarray | float,
+    cd_pier: float,
+    log_mass: float,
+    stopping_distance: float,
+    load_factor: float,
+    water_surface_velocity_factor: float,
+    pile_diameter: float = 0.0,
+    cd_pile: float = 0.0,
+    scour_depth: np.ndarray | float = 0.0,
+) -> ForceArrays:
+    """
+    Calculate forces for many rows at once using float64 array arithmetic.
+
+    This mirrors ``calculate_forces``, but operates on whole columns so that
+    Excel files can be processed without a Python-level loop.
+    Plain floats are also accepted, giving a fast single-case calculation.
+    NaN inputs propagate to NaN outputs.
+
+    Parameters
+    ----------
+    leg_type : LegType
+        Type of leg (PIER or BORED_PILE)
+    leg_config : LegConfig
+        Configuration for the leg type (PierConfig or BoredPileConfig)
+    water_depth : np.ndarray or float
+        Depth of water (m)
+    average_water_velocity : np.ndarray or float
+        Average velocity of water flow (m/s)
+    debris_mat_depth : np.ndarray or float
+        Depth of debris mat (m)
+    cd_pier : float
+        Drag coefficient for pier
+    log_mass : float
+        Mass of log for impact calculation (kg)
+    stopping_distance : float
+        Distance over which log stops (m)
+    load_factor : float
+        Safety factor applied to forces
+    water_surface_velocity_factor : float
+        Factor to convert average velocity to surface velocity
+    pile_diameter : float, optional
+        Diameter of pile (m), defaults to column_diameter if 0
+    cd_pile : float, optional
+        Drag coefficient for pile
+    scour_depth : np.ndarray or float, optional
+        Depth of scour below ground (m)
+
+    Returns
+    -------
+    ForceArrays
+        Dictionary containing calculated force and height arrays
+
+    Raises
+    ------
+    ValueError
+        If any scour_depth or the pile_diameter is negative, or the
+        stopping_distance is not positive
+    TypeError
+        If leg_config doesn't match leg_type
+    """
+    # Each formula's scalar factors are folded into a single coefficient first,
+    # so that every force costs as few passes over the arrays as possible
+    velocity_squared = average_water_velocity * average_water_velocity
+
     # Calculate above-ground forces based on leg type
     if leg_type == LegType.PIER:
-        # Pier type: use diameter and water depth for wetted area
         if not isinstance(leg_config, dict) or "diameter" not in leg_config:
             raise TypeError("Pier type requires PierConfig with diameter")
-        column_diameter = leg_config["diameter"]
-        Ad = water_depth * column_diameter
-        F1 = Decimal("0.5") * cd_pier * (average_water_velocity**2) * Ad * load_factor
-        L1 = water_depth / Decimal("2")  # Mid-height for pier type
+        # Ad = water_depth * column_diameter
+        k1 = 0.5 * cd_pier * load_factor * float(leg_config["diameter"])
+        F1 = k1 * velocity_squared * water_depth
+        L1 = water_depth / 2
     else:
-        # Bored pile type: use explicit area and 2/3 water depth
         if not isinstance(leg_config, dict) or "area" not in leg_config:
             raise TypeError("Bored pile type requires BoredPileConfig with area")
-        # area is just the area of a single face of the triangular leg of transmission tower
-        # critical case is 45 degrees, and there are two faces
-        # so the wetted area normal to the flow is area * sqrt(2)
-        Ad = leg_config["area"] * Decimal("2").sqrt()
-        F1 = Decimal("0.5") * cd_pier * (average_water_velocity**2) * Ad * load_factor
-        L1 = (Decimal("2") * water_depth) / Decimal("3")  # 2/3 height for bored pile
-
-    # Calculate surface velocity
+        # See calculate_forces: two faces at 45 degrees to the flow
+        k1 = 0.5 * cd_pier * load_factor * float(leg_config["area"]) * np.sqrt(2.0)
+        F1 = k1 * velocity_squared
+        L1 = (2 * water_depth) / 3
+
+    # Surface velocity, used for the debris Cd lookup and both surface forces
     surface_velocity = average_water_velocity * water_surface_velocity_factor
+    surface_factor_squared = water_surface_velocity_factor**2
 
-    # Calculate debris forces (same for both types)
-    debris_span = Decimal(str(DEBRIS_SPAN))  # m
-    Adeb = debris_mat_depth * debris_span
-    C_debris = Cd(surface_velocity, water_depth)
-    F2 = Decimal("0.5") * C_debris * (surface_velocity**2) * Adeb * load_factor
-    L2 = max(
-        water_depth - (debris_mat_depth / Decimal("2")), debris_mat_depth / Decimal("2")
-    )
+    # Calculate debris forces (same for both types), Adeb = depth * span
+    C_debris = Cd_vec(surface_velocity, water_depth)
+    k2 = 0.5 * load_factor * DEBRIS_SPAN * surface_factor_squared
+    F2 = k2 * C_debris * velocity_squared * debris_mat_depth
+    L2 = np.maximum(water_depth - debris_mat_depth / 2, debris_mat_depth / 2)
 
-    # Calculate log impact force
-    acceleration = (surface_velocity**2) / (Decimal("2") * stopping_distance)
-    F3 = log_mass * acceleration * load_factor / Decimal("1000")  # Convert to kN
+    # Calculate log impact force, a = surface velocity² / (2 * stopping distance)
+    if stopping_distance <= 0:
+        raise ValueError("Stopping distance must be positive.")
+    k3 = log_mass * load_factor * surface_factor_squared / (2 * stopping_distance)
+    F3 = (k3 / 1000) * velocity_squared  # Convert to kN
     L3 = water_depth
 
-    if scour_depth < 0 or pile_diameter < 0:
+    if np.any(np.asarray(scour_depth) < 0) or pile_diameter < 0:
         raise ValueError("Scour depth and pile diameter must be non-negative.")
 
     # Use column diameter if no pile diameter specified
-    # Validate and get pile diameter
     if pile_diameter == 0:
         if leg_type == LegType.PIER:
-            if isinstance(leg_config, dict) and "diameter" in leg_config:
-                pile_diameter = leg_config["diameter"]  # type: ignore
-            else:
-                raise TypeError("Pier type requires PierConfig with diameter")
+            pile_diameter = float(leg_config["diameter"])  # type: ignore
         else:  # BORED_PILE
             raise ValueError("Pile diameter must be specified for bored pile type")
 
-    Ad2 = scour_depth * pile_diameter  # Forces only apply to scoured area
-    # Fd2 - Water Flow Force on pile
-    Fd2 = Decimal("0.5") * cd_pile * (average_water_velocity**2) * Ad2 * load_factor
-    Ld2 = -scour_depth / Decimal("2")  # Force acts at midpoint of scoured area
+    # Forces only apply to the scoured area, Ad2 = scour_depth * pile_diameter
+    kd2 = 0.5 * cd_pile * load_factor * pile_diameter
+    Fd2 = kd2 * velocity_squared * scour_depth
+    Ld2 = -np.asarray(scour_depth) / 2  # Force acts at midpoint of scoured area
 
     return {
-        "F1": F1,  # Water Flow Force (kN)
-        "L1": L1,  # Height of F1 application (m)
-        "F2": F2,  # Debris Force (kN)
-        "L2": L2,  # Height of F2 application (m)
-        "F3": F3,  # Log Impact Force (kN)
-        "L3": L3,  # Height of F3 application (m)
-        "Fd2": Fd2,  # Water Flow Force on pile (kN)
-        "Ld2": Ld2,  # Height of Fd2 application (m)
+        "F1": F1,
+        "L1": L1,
+        "F2": F2,
+        "L2": L2,
+        "F3": F3,
+        "L3": L3,
+        "Fd2": Fd2,
+        "Ld2": Ld2,
     }
@@ -11,12 +11,25 @@ class LegType(Enum):
     BORED_PILE = auto()
 
 
+class OutputFormat(Enum):
+    """Enumeration for the file formats results can be downloaded in."""
+
+    EXCEL = auto()
+    CSV = auto()
+
+
 # Mapping of leg types to their display names
 LEG_TYPE_NAMES: Dict[LegType, str] = {
     LegType.PIER: "Pier Type",
     LegType.BORED_PILE: "Bored Pile",
 }
 
+# Mapping of output formats to their display names
+OUTPUT_FORMAT_NAMES: Dict[OutputFormat, str] = {
+    OutputFormat.EXCEL: "Excel (.xlsx)",
+    OutputFormat.CSV: "CSV (.csv)",
+}
+
 # Default Cd values for different leg types
 CD_VALUES: Dict[LegType, float] = {
     LegType.PIER: 0.7,  # Default for pier type (uses 0.7 above ground)
@@ -50,6 +63,9 @@ DEFAULT_SURFACE_VELOCITY_FACTOR = 1.4
 # Fixed parameters
 DEBRIS_SPAN = 20.0  # m
 
+# Number of processed files previewed on the page; all are in the download
+MAX_PREVIEW_FILES = 5
+
 # Calculator description and legal information
 CALCULATOR_DESCRIPTION = """
 The Water Flow Forces Calculator, developed by Turnbull Engineering Pty Ltd, estimates design forces on transmission tower footings in accordance with AS 5100.2 Section 16 - Forces Resulting from Water Flow.
@@ -3,48 +3,64 @@
 from decimal import Decimal
 import pandas as pd
 import numpy as np
-from .calculations import calculate_forces, calculate_actual_debris_depth
+from .calculations import calculate_forces_vec
 from .constants import LegType
-from .models import PierConfig, BoredPileConfig
+from .models import BoredPileConfig, CalculationInputs, PierConfig
 
 
-def process_dataframe(df: pd.DataFrame, inputs: dict) -> pd.DataFrame:
+def read_excel(source) -> pd.DataFrame:
     """
-    Process the input dataframe and calculate forces using Decimal for precision.
+    Read the first sheet of an Excel workbook into a dataframe.
+
+    The Rust-based calamine engine is used when python-calamine is installed,
+    as it parses workbooks several times faster than openpyxl. Otherwise the
+    openpyxl engine is used.
+
+    Parameters
+    ----------
+    source : str, path or file-like
+        Workbook to read, e.g. a Streamlit ``UploadedFile``
+
+    Returns
+    -------
+    pd.DataFrame
+        Contents of the first sheet, with the first row as the header
+    """
+    try:
+        return pd.read_excel(source, engine="calamine")
+    except ImportError:
+        return pd.read_excel(source, engine="openpyxl")
+
+
+def process_dataframe(df: pd.DataFrame, inputs: CalculationInputs) -> pd.DataFrame:
+    """
+    Process the input dataframe and calculate forces for every row at once.
 
     Parameters
     ----------
     df : pd.DataFrame
-        Input dataframe containing flood event data
-    inputs : dict
-        Dictionary of input parameters including:
-        - selected_event: str, e.g. "1% AEP" or "PMF"
-        - leg_type: LegType
-        - column_diameter: str (for pier type)
-        - wetted_area: str (for bored pile type)
-        - cd: str
-        - pile_diameter: str
-        - cd_pile: str
-        - min_debris_depth: str
-        - max_debris_depth: str
-        - log_mass: str
-        - stopping_distance: str
-        - load_factor: str
+        Input dataframe containing flood event data. It is modified in place
+        and returned with the result columns appended.
+    inputs : CalculationInputs
+        Sidebar inputs applied to every row
 
     Returns
     -------
     pd.DataFrame
-        The input dataframe with additional columns for calculated forces
+        The input dataframe with additional float columns for calculated
+        forces, which are NaN for rows with missing or invalid inputs
 
     Raises
     ------
     ValueError
         If required columns are missing from the dataframe
     """
-    df.columns = df.columns.str.replace("\n", " ").str.strip()
+    # Plain str methods also cope with non-string headers, e.g. numeric cells,
+    # which the .str accessor would turn into NaN
+    df.columns = [str(col).replace("\n", " ").strip() for col in df.columns]
 
     # Use selected event for column names
-    event = inputs["selected_event"]  # e.g. "1% AEP" or "PMF"
+    event = inputs.selected_event  # e.g. "1% AEP" or "PMF"
     VELOCITY_COL = f"{event} Event Peak Velocity"
     DEPTH_COL = f"{event} Event Peak Flood Depth"
     SCOUR_COL = f"{event} Event Scour"
@@ -57,116 +73,69 @@ def process_dataframe(df: pd.DataFrame, inputs: dict) -> pd.DataFrame:
     if SCOUR_COL not in df.columns:
         missing_cols.append(SCOUR_COL)
 
-    df[VELOCITY_COL] = pd.to_numeric(df[VELOCITY_COL], errors="coerce")
-    df[DEPTH_COL] = pd.to_numeric(df[DEPTH_COL], errors="coerce")
-    df[SCOUR_COL] = pd.to_numeric(df[SCOUR_COL], errors="coerce")
-
     if missing_cols:
         raise ValueError(f"Missing required columns: {', '.join(missing_cols)}")
 
-    results = []
-
-    def is_invalid_value(val):
-        """Check if a value is invalid (NaN or None)."""
-        if pd.isna(val) or val == np.nan:
-            return True
-        return False
+    # Coerce the input columns that are not already numeric, e.g. where a cell
+    # holds text, in one assignment
+    text_cols = [
+        col
+        for col in (VELOCITY_COL, DEPTH_COL, SCOUR_COL)
+        if not pd.api.types.is_numeric_dtype(df[col])
+    ]
+    if text_cols:
+        df[text_cols] = df[text_cols].apply(pd.to_numeric, errors="coerce")
 
-    # Convert string leg type back to enum
-    leg_type = LegType(int(inputs["leg_type"]))
+    leg_type = inputs.leg_type
 
     # Set up leg configuration based on type
     if leg_type == LegType.PIER:
-        pier_config: PierConfig = {"diameter": Decimal(str(inputs["column_diameter"]))}
+        pier_config: PierConfig = {"diameter": Decimal(str(inputs.column_diameter))}
         leg_config = pier_config
     else:  # BORED_PILE
-        bored_config: BoredPileConfig = {"area": Decimal(str(inputs["wetted_area"]))}
+        bored_config: BoredPileConfig = {"area": Decimal(str(inputs.wetted_area))}
         leg_config = bored_config
 
-    # Extract the water surface velocity factor
-    water_surface_velocity_factor = Decimal(
-        str(inputs["water_surface_velocity_factor"])
+    # Take each input as a float64 array once, viewing the column data where
+    # it is already float64, so all the arithmetic below stays in NumPy
+    water_depth = df[DEPTH_COL].to_numpy(dtype=np.float64, na_value=np.nan)
+    water_velocity = df[VELOCITY_COL].to_numpy(dtype=np.float64, na_value=np.nan)
+    scour_depth = df[SCOUR_COL].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    # Rows with any missing value are reported as N/A for all results, so blank
+    # out all three inputs for those rows and let NaN propagate through
+    invalid = np.isnan(water_depth) | np.isnan(water_velocity) | np.isnan(scour_depth)
+    water_depth = np.where(invalid, np.nan, water_depth)
+    water_velocity = np.where(invalid, np.nan, water_velocity)
+    scour_depth = np.where(invalid, np.nan, scour_depth)
+
+    # Same clamp as calculate_actual_debris_depth, in a single pass
+    actual_debris_depth = np.clip(
+        water_depth, inputs.min_debris_depth, inputs.max_debris_depth
     )
 
-    for idx, row in df.iterrows():
-        water_depth = row[DEPTH_COL]
-        water_velocity = row[VELOCITY_COL]
-        scour_depth = row[SCOUR_COL]
-
-        # If any value is invalid, output N/A for all results
-        if (
-            is_invalid_value(water_depth)
-            or is_invalid_value(water_velocity)
-            or is_invalid_value(scour_depth)
-        ):
-            results.append(
-                {
-                    "F1": "N/A",
-                    "L1": "N/A",
-                    "F2": "N/A",
-                    "L2": "N/A",
-                    "F3": "N/A",
-                    "L3": "N/A",
-                    "Fd2": "N/A",
-                    "Ld2": "N/A",
-                }
-            )
-            continue
-
-        # Convert all inputs to Decimal for consistent precision
-        decimal_water_depth = Decimal(str(water_depth))
-        decimal_water_velocity = Decimal(str(water_velocity))
-        decimal_scour_depth = Decimal(str(scour_depth))
-
-        actual_debris_depth = calculate_actual_debris_depth(
-            decimal_water_depth,
-            Decimal(str(inputs["min_debris_depth"])),
-            Decimal(str(inputs["max_debris_depth"])),
-        )
-
-        pile_diameter = Decimal(str(inputs["pile_diameter"]))
-
-        forces = calculate_forces(
-            leg_type=leg_type,
-            leg_config=leg_config,
-            water_depth=decimal_water_depth,
-            average_water_velocity=decimal_water_velocity,
-            debris_mat_depth=actual_debris_depth,  # Already a Decimal
-            cd_pier=Decimal(str(inputs["cd"])),
-            log_mass=Decimal(str(inputs["log_mass"])),
-            stopping_distance=Decimal(str(inputs["stopping_distance"])),
-            load_factor=Decimal(str(inputs["load_factor"])),
-            water_surface_velocity_factor=water_surface_velocity_factor,
-            pile_diameter=pile_diameter,
-            cd_pile=Decimal(str(inputs["cd_pile"])),
-            scour_depth=decimal_scour_depth,  # Use scour depth from Excel data
-        )
-
-        results.append(
-            {
-                "F1": float(forces["F1"]),
-                "L1": float(forces["L1"]),
-                "F2": float(forces["F2"]),
-                "L2": float(forces["L2"]),
-                "F3": float(forces["F3"]),
-                "L3": float(forces["L3"]),
-                "Fd2": float(forces["Fd2"]),
-                "Ld2": float(forces["Ld2"]),
-            }
-        )
-
-    # Process results and combine with original dataframe
-    results_df = pd.DataFrame(results)
-    combined_df = pd.concat([df, results_df], axis=1)
-    combined_df.replace(
-        to_replace=[np.inf, -np.inf, np.nan],
-        value="N/A",
-        inplace=True,
+    forces = calculate_forces_vec(
+        leg_type=leg_type,
+        leg_config=leg_config,
+        water_depth=water_depth,
+        average_water_velocity=water_velocity,
+        debris_mat_depth=actual_debris_depth,
+        cd_pier=inputs.cd,
+        log_mass=inputs.log_mass,
+        stopping_distance=inputs.stopping_distance,
+        load_factor=inputs.load_factor,
+        water_surface_velocity_factor=inputs.water_surface_velocity_factor,
+        pile_diameter=inputs.pile_diameter,
+        cd_pile=inputs.cd_pile,
+        scour_depth=scour_depth,  # Use scour depth from Excel data
     )
 
-    # Ensure all object columns are strings for consistent handling
-    object_columns = combined_df.select_dtypes(include=["object"]).columns
-    for col in object_columns:
-        combined_df[col] = combined_df[col].astype(str)
+    # Results that cannot be calculated from the data columns, i.e. NaN from
+    # invalid rows or inf from infinite or overflowing cell values, are left
+    # as NaN and written out as N/A on export.
+    # Append in place rather than with assign(), which copies the whole frame
+    for name, values in forces.items():
+        column = np.asarray(values)
+        df[name] = np.where(np.isfinite(column), column, np.nan)
 
-    return combined_df
+    return df
@@ -1,7 +1,10 @@
 """Type definitions for the Water Flow Forces Calculator."""
 
+from dataclasses import dataclass
 from typing import TypedDict, Union
 from decimal import Decimal
+import numpy as np
+from .constants import LegType
 
 
 class ForceResults(TypedDict):
@@ -37,6 +40,24 @@ class ForceResults(TypedDict):
     Ld2: Decimal  # Height of Fd2 application, must be negative (m)
 
 
+class ForceArrays(TypedDict):
+    """Type hints for vectorized force calculation results.
+
+    Each entry holds one float64 value per input row, in the same units as
+    the corresponding field of ForceResults, or a single value when the
+    inputs are plain floats.
+    """
+
+    F1: np.ndarray | float  # Water Flow Force on pier (kN)
+    L1: np.ndarray | float  # Height of F1 application (m)
+    F2: np.ndarray | float  # Debris Force (kN)
+    L2: np.ndarray | float  # Height of F2 application (m)
+    F3: np.ndarray | float  # Log Impact Force (kN)
+    L3: np.ndarray | float  # Height of F3 application (m)
+    Fd2: np.ndarray | float  # Water Flow Force on pile (kN)
+    Ld2: np.ndarray | float  # Height of Fd2 application, must be negative (m)
+
+
 class PierConfig(TypedDict):
     """Configuration for pier type leg.
 
@@ -61,5 +82,57 @@ class BoredPileConfig(TypedDict):
     area: Decimal
 
 
+@dataclass(frozen=True, slots=True)
+class CalculationInputs:
+    """Sidebar inputs shared by every row of every uploaded file.
+
+    Built once per script run from the widget values, so the numbers are
+    passed around already parsed. Being frozen, it can also key caches.
+
+    Attributes
+    ----------
+    selected_event : str
+        Event whose columns are read, e.g. "1% AEP" or "PMF"
+    leg_type : LegType
+        Type of structure
+    cd : float
+        Drag coefficient above ground
+    pile_diameter : float
+        Diameter of the pile below ground (m)
+    cd_pile : float
+        Drag coefficient below ground
+    min_debris_depth : float
+        Minimum debris mat depth (m), 0 when not enabled
+    max_debris_depth : float
+        Maximum debris mat depth (m), effectively unbounded when not enabled
+    log_mass : float
+        Mass of log for impact calculation (kg)
+    stopping_distance : float
+        Distance over which log stops (m)
+    load_factor : float
+        Safety factor applied to forces
+    water_surface_velocity_factor : float
+        Factor to convert average velocity to surface velocity
+    column_diameter : float or None
+        Diameter of the pier (m), for the pier type only
+    wetted_area : float or None
+        Area exposed to water flow (m²), for the bored pile type only
+    """
+
+    selected_event: str
+    leg_type: LegType
+    cd: float
+    pile_diameter: float
+    cd_pile: float
+    min_debris_depth: float
+    max_debris_depth: float
+    log_mass: float
+    stopping_distance: float
+    load_factor: float
+    water_surface_velocity_factor: float
+    column_diameter: float | None = None
+    wetted_area: float | None = None
+
+
 # Union type for leg configuration
 LegConfig = Union[PierConfig, BoredPileConfig]
@@ -1,52 +1,61 @@
 """Visualization functions for the Water Flow Forces Calculator."""
 
 from decimal import Decimal
-import matplotlib.pyplot as plt
+from io import BytesIO
 import matplotlib.patches
 import matplotlib.figure
 
+# Style shared by the force arrows
+_FORCE_ARROW_PROPS = {
+    "width": 0.5,
+    "head_width": 0.3,
+    "head_length": 0.3,
+    "fc": "red",
+    "ec": "red",
+}
+
 
 def draw_column_diagram(
-    water_depth: Decimal,
+    water_depth: float | Decimal,
     column_diameter: float,
-    debris_mat_depth: Decimal,
-    F1: Decimal,
-    F2: Decimal,
-    F3: Decimal,
-    L1: Decimal,
-    L2: Decimal,
-    L3: Decimal,
-    Fd2: Decimal = Decimal("0"),
-    Ld2: Decimal = Decimal("0"),
+    debris_mat_depth: float | Decimal,
+    F1: float | Decimal,
+    F2: float | Decimal,
+    F3: float | Decimal,
+    L1: float | Decimal,
+    L2: float | Decimal,
+    L3: float | Decimal,
+    Fd2: float | Decimal = 0.0,
+    Ld2: float | Decimal = 0.0,
     pile_diameter: float = 0.0,
     scour_depth: float = 0.0,
 ) -> matplotlib.figure.Figure:
     """
-    Draw the column forces diagram with proper handling of Decimal values.
+    Draw the column forces diagram from float or Decimal values.
 
     Parameters
     ----------
-    water_depth : Decimal
+    water_depth : float or Decimal
         Depth of water from ground level
     column_diameter : float
         Diameter of the pier/column
-    debris_mat_depth : Decimal
+    debris_mat_depth : float or Decimal
         Depth of debris mat
-    F1 : Decimal
+    F1 : float or Decimal
         Water Flow Force on pier (kN)
-    F2 : Decimal
+    F2 : float or Decimal
         Debris Force (kN)
-    F3 : Decimal
+    F3 : float or Decimal
         Log Impact Force (kN)
-    L1 : Decimal
+    L1 : float or Decimal
         Height of F1 application (m)
-    L2 : Decimal
+    L2 : float or Decimal
         Height of F2 application (m)
-    L3 : Decimal
+    L3 : float or Decimal
         Height of F3 application (m)
-    Fd2 : Decimal, optional
+    Fd2 : float or Decimal, optional
         Water Flow Force on pile (kN)
-    Ld2 : Decimal, optional
+    Ld2 : float or Decimal, optional
         Height of Fd2 application (m)
     pile_diameter : float, optional
         Diameter of the pile
@@ -58,14 +67,23 @@ def draw_column_diagram(
     matplotlib.figure.Figure
         The generated figure containing the diagram
     """
-    fig, ax = plt.subplots(figsize=(10, 8))
+    # Convert the inputs to float once; the drawing works in floats
+    depth = float(water_depth)
+    debris_depth = float(debris_mat_depth)
+    pile_force = float(Fd2)
+    pile_lever_arm = float(Ld2)
+
+    # Build the figure directly rather than through pyplot, so it is not
+    # registered with pyplot's global figure manager and needs no closing
+    fig = matplotlib.figure.Figure(figsize=(10, 8))
+    ax = fig.subplots()
 
     # Ground
     ground_level = 0
     ax.axhline(y=ground_level, color="brown", linestyle="-", linewidth=2)
 
     # Calculate actual column height first
-    actual_column_height = float(water_depth) + 1.5
+    actual_column_height = depth + 1.5
 
     # Column
     column_bottom = ground_level
@@ -80,15 +98,13 @@ def draw_column_diagram(
     ax.add_patch(rect)
 
     # Water level
-    water_y = ground_level + float(water_depth)
+    water_y = ground_level + depth
     ax.axhline(y=water_y, color="blue", linestyle="--", alpha=0.5)
     ax.text(0.5, water_y, "Water Level", verticalalignment="bottom")
 
     # Debris mat
-    debris_y = max(
-        ground_level, water_y - float(debris_mat_depth)
-    )  # Don't go below ground
-    debris_height = float(debris_mat_depth)
+    debris_y = max(ground_level, water_y - debris_depth)  # Don't go below ground
+    debris_height = debris_depth
     if debris_y + debris_height < water_y:
         debris_height = water_y - debris_y  # Adjust height to not exceed water level
 
@@ -109,52 +125,23 @@ def draw_column_diagram(
         rotation=90,
     )
 
-    # Forces
-    arrow_props = dict(width=0.5, head_width=0.3, head_length=0.3, fc="red", ec="red")
-    # F1 at L1
-    ax.arrow(
-        column_x + column_diameter / 2 + 1,
-        ground_level + float(L1),
-        2,
-        0,
-        **arrow_props,
-    )
-    ax.text(
-        column_x + column_diameter / 2 + 3.5,
-        ground_level + float(L1),
-        f"F1 = {float(F1):.1f} kN @ L1 = {float(L1):.1f} m",
-        verticalalignment="center",
-    )
-
-    # F2 at L2
-    ax.arrow(
-        column_x + column_diameter / 2 + 1,
-        ground_level + float(L2),
-        2,
-        0,
-        **arrow_props,
-    )
-    ax.text(
-        column_x + column_diameter / 2 + 3.5,
-        ground_level + float(L2),
-        f"F2 = {float(F2):.1f} kN @ L2 = {float(L2):.1f} m",
-        verticalalignment="center",
-    )
-
-    # F3 at L3
-    ax.arrow(
-        column_x + column_diameter / 2 + 1,
-        ground_level + float(L3),
-        2,
-        0,
-        **arrow_props,
-    )
-    ax.text(
-        column_x + column_diameter / 2 + 3.5,
-        ground_level + float(L3),
-        f"F3 = {float(F3):.1f} kN @ L3 = {float(L3):.1f} m",
-        verticalalignment="center",
+    # Forces, drawn as arrows to the right of the column
+    force_arrow_x = column_x + column_diameter / 2 + 1
+    force_label_x = column_x + column_diameter / 2 + 3.5
+    forces = (
+        ("1", float(F1), float(L1)),
+        ("2", float(F2), float(L2)),
+        ("3", float(F3), float(L3)),
     )
+    for name, force, lever_arm in forces:
+        y = ground_level + lever_arm
+        ax.arrow(force_arrow_x, y, 2, 0, **_FORCE_ARROW_PROPS)
+        ax.text(
+            force_label_x,
+            y,
+            f"F{name} = {force:.1f} kN @ L{name} = {lever_arm:.1f} m",
+            verticalalignment="center",
+        )
 
     # Dimensions
     ax.annotate(
@@ -166,7 +153,7 @@ def draw_column_diagram(
     ax.text(
         column_x - column_diameter / 2 - 1,
         (ground_level + water_y) / 2,
-        f"Water Depth\n{float(water_depth):.1f} m",
+        f"Water Depth\n{depth:.1f} m",
         verticalalignment="center",
     )
 
@@ -220,18 +207,18 @@ def draw_column_diagram(
         ax.add_patch(pile_rect)
 
         # Fd2 at Ld2 (below ground)
-        if float(Fd2) > 0:
+        if pile_force > 0:
             ax.arrow(
                 column_x + pile_diameter / 2 + 1,
-                ground_level + float(Ld2),  # Ld2 is negative
+                ground_level + pile_lever_arm,  # Ld2 is negative
                 2,
                 0,
-                **arrow_props,
+                **_FORCE_ARROW_PROPS,
             )
             ax.text(
                 column_x + pile_diameter / 2 + 3.5,
-                ground_level + float(Ld2),
-                f"Fd2 = {float(Fd2):.1f} kN @ Ld2 = {float(Ld2):.1f} m",
+                ground_level + pile_lever_arm,
+                f"Fd2 = {pile_force:.1f} kN @ Ld2 = {pile_lever_arm:.1f} m",
                 verticalalignment="center",
             )
 
@@ -260,3 +247,23 @@ def draw_column_diagram(
     ax.set_aspect("equal")
 
     return fig
+
+
+def render_column_diagram_png(**kwargs) -> bytes:
+    """
+    Render the column forces diagram to PNG bytes.
+
+    Parameters
+    ----------
+    **kwargs
+        Arguments passed to ``draw_column_diagram``
+
+    Returns
+    -------
+    bytes
+        The diagram as a PNG image
+    """
+    fig = draw_column_diagram(**kwargs)
+    buffer = BytesIO()
+    fig.savefig(buffer, format="png", dpi=200, bbox_inches="tight")
+    return buffer.getvalue()
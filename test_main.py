@@ -1,10 +1,13 @@
 """Unit tests for the Water Flow Forces Calculator."""
 
 import pytest
+import numpy as np
+import pandas as pd
 from decimal import Decimal
-from src.calculations import calculate_forces
+from src.calculations import Cd, Cd_vec, calculate_forces, calculate_forces_vec
 from src.constants import LegType
-from src.models import PierConfig, BoredPileConfig
+from src.data_processing import process_dataframe
+from src.models import BoredPileConfig, CalculationInputs, PierConfig
 
 
 def test_calculate_forces_pier_type():
@@ -239,3 +242,151 @@ def test_bored_pile_requires_pile_diameter():
             water_surface_velocity_factor=Decimal("1.4"),
             # pile_diameter not provided
         )
+
+
+def test_cd_vec_matches_scalar_cd():
+    """Test the vectorized Cd against the scalar ladder, including breakpoints."""
+    # Arrange - V²y values on and between every breakpoint, with V = 1
+    depths = np.array([0.0, 20, 40, 50, 60, 70, 85, 90, 100, 115, 130, 200, 260, 300])
+    velocities = np.ones_like(depths)
+
+    # Act
+    result = Cd_vec(velocities, depths)
+
+    # Assert
+    for i, depth in enumerate(depths):
+        expected = Cd(Decimal("1"), Decimal(str(depth)))
+        assert result[i] == pytest.approx(float(expected), rel=1e-9)
+
+
+@pytest.mark.parametrize("leg_type", [LegType.PIER, LegType.BORED_PILE])
+def test_calculate_forces_vec_matches_scalar(leg_type):
+    """Test the vectorized calculation against the Decimal implementation."""
+    # Arrange - depths and velocities spanning every Cd segment
+    water_depths = np.array([0.5, 1.2, 2.0, 3.5, 5.0, 8.0, 12.0])
+    velocities = np.array([3.2, 4.6, 4.2, 3.6, 3.4, 3.6, 4.1])
+    scour_depths = np.array([0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0])
+    debris_depths = np.clip(water_depths, 1.2, 3.0)
+    leg_config = (
+        {"diameter": Decimal("2.5")}
+        if leg_type == LegType.PIER
+        else {"area": Decimal("20.0")}
+    )
+    params = {
+        "cd_pier": "0.7",
+        "log_mass": "2000",
+        "stopping_distance": "0.075",
+        "load_factor": "1.3",
+        "water_surface_velocity_factor": "1.4",
+        "pile_diameter": "2.5",
+        "cd_pile": "0.7",
+    }
+
+    # Act
+    result = calculate_forces_vec(
+        leg_type=leg_type,
+        leg_config=leg_config,
+        water_depth=water_depths,
+        average_water_velocity=velocities,
+        debris_mat_depth=debris_depths,
+        scour_depth=scour_depths,
+        **{key: float(value) for key, value in params.items()},
+    )
+
+    # Assert
+    for i in range(len(water_depths)):
+        expected = calculate_forces(
+            leg_type=leg_type,
+            leg_config=leg_config,
+            water_depth=Decimal(str(water_depths[i])),
+            average_water_velocity=Decimal(str(velocities[i])),
+            debris_mat_depth=Decimal(str(debris_depths[i])),
+            scour_depth=Decimal(str(scour_depths[i])),
+            **{key: Decimal(value) for key, value in params.items()},
+        )
+        for key, value in expected.items():
+            assert result[key][i] == pytest.approx(float(value), rel=1e-9, abs=1e-12)
+
+
+def test_calculate_forces_vec_rejects_negative_scour():
+    """Test that any negative scour depth in the batch raises ValueError."""
+    with pytest.raises(ValueError):
+        calculate_forces_vec(
+            leg_type=LegType.PIER,
+            leg_config={"diameter": Decimal("2.5")},
+            water_depth=np.array([8.0, 8.0]),
+            average_water_velocity=np.array([3.0, 3.0]),
+            debris_mat_depth=np.array([2.0, 2.0]),
+            cd_pier=0.7,
+            log_mass=10000.0,
+            stopping_distance=0.025,
+            load_factor=1.3,
+            water_surface_velocity_factor=1.4,
+            scour_depth=np.array([1.0, -0.5]),
+        )
+
+
+def test_calculate_forces_vec_rejects_zero_stopping_distance():
+    """Test that a zero stopping distance raises ValueError."""
+    with pytest.raises(ValueError):
+        calculate_forces_vec(
+            leg_type=LegType.PIER,
+            leg_config={"diameter": Decimal("2.5")},
+            water_depth=np.array([8.0, 8.0]),
+            average_water_velocity=np.array([3.0, 3.0]),
+            debris_mat_depth=np.array([2.0, 2.0]),
+            cd_pier=0.7,
+            log_mass=10000.0,
+            stopping_distance=0.0,
+            load_factor=1.3,
+            water_surface_velocity_factor=1.4,
+            scour_depth=np.array([1.0, 1.0]),
+        )
+
+
+# Sidebar inputs shared by the process_dataframe tests; frozen, so safe to reuse
+PIER_INPUTS = CalculationInputs(
+    selected_event="1% AEP",
+    leg_type=LegType.PIER,
+    cd=0.7,
+    pile_diameter=2.5,
+    cd_pile=0.7,
+    min_debris_depth=1.2,
+    max_debris_depth=3.0,
+    log_mass=10000,
+    stopping_distance=0.025,
+    load_factor=1.3,
+    water_surface_velocity_factor=1.4,
+    column_diameter=2.5,
+)
+
+
+def test_process_dataframe_leaves_invalid_rows_as_nan():
+    """Test that rows with missing or non-numeric inputs give NaN forces."""
+    # Arrange
+    df = pd.DataFrame(
+        {
+            "1% AEP Event\nPeak Flood Depth": [8.0, "dry", 8.0],
+            "1% AEP Event Peak Velocity": [3.0, 3.0, None],
+            "1% AEP Event Scour": [1.0, 1.0, 1.0],
+        }
+    )
+
+    # Act
+    result = process_dataframe(df, PIER_INPUTS)
+
+    # Assert
+    force_columns = ["F1", "L1", "F2", "L2", "F3", "L3", "Fd2", "Ld2"]
+    assert (result[force_columns].dtypes == np.float64).all()
+    assert result.loc[0, force_columns].notna().all()
+    assert result.loc[1:, force_columns].isna().all().all()
+
+
+def test_process_dataframe_reports_missing_columns():
+    """Test that missing event columns raise a ValueError naming them."""
+    # Arrange
+    df = pd.DataFrame({"1% AEP Event Peak Velocity": [3.0]})
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="1% AEP Event Peak Flood Depth"):
+        process_dataframe(df, PIER_INPUTS)